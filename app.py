@@ -1,4 +1,788 @@
-() or "MOW"
+"""Lawncare Job Management CLI.
+
+Single-file job management tool for a small lawncare business: clients,
+services and (repeat) bookings live in simple in-memory stores behind a thin
+session facade, so the domain models and repository functions can later be
+lifted onto a real database/API without touching the menus.
+"""
+
+import bisect
+import sys
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from typing import Dict, Iterable, List, Optional
+
+
+# =====
+# Models
+# =====
+
+class RepeatFrequency(Enum):
+    NONE = "none"
+    WEEKLY = "weekly"
+    FORTNIGHTLY = "fortnightly"
+    MONTHLY = "monthly"
+
+
+class BookingStatus(Enum):
+    SCHEDULED = "scheduled"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+
+# Repeat frequency -> spacing between occurrences. NONE is deliberately
+# absent so lookups fall through to the single-occurrence path.
+_REPEAT_DELTA = {
+    RepeatFrequency.WEEKLY: timedelta(weeks=1),
+    RepeatFrequency.FORTNIGHTLY: timedelta(weeks=2),
+    RepeatFrequency.MONTHLY: timedelta(days=30),
+}
+
+# Same table in whole days, for bulk expansion over date ordinals.
+_REPEAT_STEP_DAYS = {
+    RepeatFrequency.WEEKLY: 7,
+    RepeatFrequency.FORTNIGHTLY: 14,
+    RepeatFrequency.MONTHLY: 30,
+}
+
+# Plain value->member maps so menu input parsing skips EnumMeta.__call__.
+_REPEAT_FROM_STR = {m.value: m for m in RepeatFrequency}
+_STATUS_FROM_STR = {m.value: m for m in BookingStatus}
+
+
+def _expand_schedule(scheduled_date: date, repeat: RepeatFrequency,
+                     occurrences: int) -> List[date]:
+    step = _REPEAT_DELTA.get(repeat)
+    if step is None or occurrences <= 1:
+        return [scheduled_date]
+    return [scheduled_date + i * step for i in range(occurrences)]
+
+
+@dataclass(slots=True)
+class Client:
+    id: int
+    first_name: str
+    last_name: str
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    address: Optional[str] = None
+    notes: Optional[str] = None
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}".strip()
+
+
+@dataclass(slots=True)
+class Service:
+    id: int
+    code: str
+    name: str
+    description: Optional[str] = None
+    base_price: Decimal = Decimal("0.00")
+    duration_minutes: int = 0
+    active: bool = True
+
+
+@dataclass(slots=True)
+class Booking:
+    id: int
+    client_id: int
+    service_code: str
+    scheduled_date: date
+    repeat: RepeatFrequency = RepeatFrequency.NONE
+    occurrences: int = 1
+    status: BookingStatus = BookingStatus.SCHEDULED
+    notes: Optional[str] = None
+    unit_charge: Optional[Decimal] = None
+    _occ_cache: Optional[List[date]] = field(init=False, default=None,
+                                             repr=False, compare=False)
+
+    def occurrence_dates(self) -> List[date]:
+        """Expand the repeat rule into the concrete dates of this booking.
+
+        The expansion is memoized on the instance; callers that render a
+        booking twice do not pay for the date arithmetic again.
+        """
+        cached = self._occ_cache
+        if cached is None:
+            cached = _expand_schedule(self.scheduled_date, self.repeat,
+                                      self.occurrences)
+            self._occ_cache = cached
+        return cached
+
+
+# Field names cached per class so serialization does not re-introspect
+# __dataclass_fields__ on every record (JSON/API output will be row-at-a-time).
+Client._field_names = tuple(f.name for f in fields(Client))
+Service._field_names = tuple(f.name for f in fields(Service))
+Booking._field_names = tuple(f.name for f in fields(Booking)
+                             if not f.name.startswith("_"))
+
+
+def fast_asdict(obj) -> dict:
+    """Shallow dict of a model's fields, using the cached field names.
+
+    Cheaper than ``dataclasses.asdict``, which re-walks ``fields()`` (and
+    recurses) on every call.
+    """
+    return {name: getattr(obj, name) for name in type(obj)._field_names}
+
+
+# =====
+# In-memory stores
+# =====
+
+def _canonical_code(code: str) -> str:
+    """Uppercase a service code, skipping the allocation when it already is."""
+    if code.isascii() and code.isupper():
+        return code
+    return code.upper()
+
+
+class ClientDB:
+    """Clients stored column-wise (structure-of-arrays).
+
+    Scans such as ``_print_clients`` touch only the columns they format
+    instead of dereferencing a full object per row; ``get``/``list`` build
+    ``Client`` views on demand. ``_index`` maps client id -> row position.
+    """
+
+    def __init__(self) -> None:
+        self._ids: List[int] = []
+        self._first: List[str] = []
+        self._last: List[str] = []
+        self._full: List[str] = []
+        self._email: List[Optional[str]] = []
+        self._phone: List[Optional[str]] = []
+        self._address: List[Optional[str]] = []
+        self._notes: List[Optional[str]] = []
+        self._index: Dict[int, int] = {}
+        self._next_id = 0
+
+    def _columns(self) -> tuple:
+        return (self._ids, self._first, self._last, self._full, self._email,
+                self._phone, self._address, self._notes)
+
+    def _row(self, row: int) -> Client:
+        return Client(id=self._ids[row], first_name=self._first[row],
+                      last_name=self._last[row], email=self._email[row],
+                      phone=self._phone[row], address=self._address[row],
+                      notes=self._notes[row])
+
+    def add(self, first_name: str, last_name: str, email: Optional[str] = None,
+            phone: Optional[str] = None, address: Optional[str] = None,
+            notes: Optional[str] = None) -> Client:
+        self._next_id += 1
+        cid = self._next_id
+        self._index[cid] = len(self._ids)
+        self._ids.append(cid)
+        self._first.append(first_name)
+        self._last.append(last_name)
+        # Materialized once here rather than re-formatted on every listing.
+        self._full.append(f"{first_name} {last_name}".strip())
+        self._email.append(email)
+        self._phone.append(phone)
+        self._address.append(address)
+        self._notes.append(notes)
+        return self._row(self._index[cid])
+
+    def bulk_add(self, rows: List[tuple]) -> List[int]:
+        """Append many (first_name, last_name, email, phone, address, notes)
+        rows at once, reserving the whole id range up front.
+
+        Returns the assigned client ids in row order.
+        """
+        start = self._next_id + 1
+        self._next_id += len(rows)
+        ids = list(range(start, self._next_id + 1))
+        base = len(self._ids)
+        self._index.update((cid, base + i) for i, cid in enumerate(ids))
+        self._ids.extend(ids)
+        self._first.extend(r[0] for r in rows)
+        self._last.extend(r[1] for r in rows)
+        self._full.extend(f"{r[0]} {r[1]}".strip() for r in rows)
+        self._email.extend(r[2] for r in rows)
+        self._phone.extend(r[3] for r in rows)
+        self._address.extend(r[4] for r in rows)
+        self._notes.extend(r[5] for r in rows)
+        return ids
+
+    def get(self, client_id: int) -> Optional[Client]:
+        row = self._index.get(client_id)
+        return self._row(row) if row is not None else None
+
+    def update(self, client_id: int, **kwargs) -> Optional[Client]:
+        row = self._index.get(client_id)
+        if row is None:
+            return None
+        columns = {'first_name': self._first, 'last_name': self._last,
+                   'email': self._email, 'phone': self._phone,
+                   'address': self._address, 'notes': self._notes}
+        for key, value in kwargs.items():
+            columns[key][row] = value
+        if 'first_name' in kwargs or 'last_name' in kwargs:
+            self._full[row] = f"{self._first[row]} {self._last[row]}".strip()
+        return self._row(row)
+
+    def full_name_of(self, client_id: int) -> Optional[str]:
+        row = self._index.get(client_id)
+        return self._full[row] if row is not None else None
+
+    def delete(self, client_id: int) -> bool:
+        row = self._index.pop(client_id, None)
+        if row is None:
+            return False
+        for column in self._columns():
+            del column[row]
+        for cid, r in self._index.items():
+            if r > row:
+                self._index[cid] = r - 1
+        return True
+
+    def iter_rows(self) -> Iterable[tuple]:
+        """Yield (id, full_name, email, phone) without building views."""
+        return zip(self._ids, self._full, self._email, self._phone)
+
+    def list(self) -> Iterable[Client]:
+        """Lazy view over all clients; no list is allocated per call."""
+        return (self._row(row) for row in range(len(self._ids)))
+
+    def snapshot(self) -> List[Client]:
+        """Materialized copy, for callers that mutate while iterating."""
+        return list(self.list())
+
+
+class ServiceCatalog:
+    def __init__(self) -> None:
+        self._services: Dict[int, Service] = {}
+        self._by_code: Dict[str, int] = {}
+        self._next_id = 0
+
+    def add(self, code: str, name: str, description: Optional[str] = None,
+            base_price: Decimal = Decimal("0.00"), duration_minutes: int = 0) -> Service:
+        # Interned: codes are low-cardinality and repeated across bookings.
+        code = sys.intern(_canonical_code(code))
+        if code in self._by_code:
+            raise ValueError(f"Service code '{code}' already exists")
+        self._next_id += 1
+        sid = self._next_id
+        service = Service(id=sid, code=code, name=name, description=description,
+                          base_price=base_price, duration_minutes=duration_minutes)
+        self._services[sid] = service
+        self._by_code[code] = sid
+        return service
+
+    def get(self, code: str) -> Optional[Service]:
+        sid = self._by_code.get(_canonical_code(code))
+        return self._services.get(sid) if sid is not None else None
+
+    def get_by_id(self, service_id: int) -> Optional[Service]:
+        return self._services.get(service_id)
+
+    def update(self, service_id: int, **kwargs) -> Optional[Service]:
+        service = self._services.get(service_id)
+        if not service:
+            return None
+        new_code = kwargs.get('code')
+        if new_code and _canonical_code(new_code) != service.code:
+            new_code = sys.intern(_canonical_code(new_code))
+            if new_code in self._by_code:
+                raise ValueError(f"Service code '{new_code}' already exists")
+            del self._by_code[service.code]
+            self._by_code[new_code] = service_id
+            kwargs['code'] = new_code
+        for key, value in kwargs.items():
+            setattr(service, key, value)
+        return service
+
+    def delete(self, service_id: int) -> bool:
+        service = self._services.pop(service_id, None)
+        if not service:
+            return False
+        del self._by_code[service.code]
+        return True
+
+    def list(self) -> Iterable[Service]:
+        """Live dict view over all services; no list is allocated per call."""
+        return self._services.values()
+
+    def snapshot(self) -> List[Service]:
+        """Materialized copy, for callers that mutate while iterating."""
+        return list(self._services.values())
+
+
+class BookingManager:
+    """Bookings stored column-wise, mirroring :class:`ClientDB`."""
+
+    def __init__(self) -> None:
+        self._ids: List[int] = []
+        self._client_ids: List[int] = []
+        self._service_codes: List[str] = []
+        self._dates: List[date] = []
+        # Scheduled dates doubled as day ordinals in a compact int column;
+        # bulk scans read machine ints instead of dereferencing date objects.
+        self._date_ords = array("q")
+        self._repeats: List[RepeatFrequency] = []
+        self._occurrences: List[int] = []
+        self._statuses: List[BookingStatus] = []
+        self._notes: List[Optional[str]] = []
+        self._charges: List[Optional[Decimal]] = []
+        # Occurrence dates materialized at insert; reads vastly outnumber
+        # writes here, so the expansion is paid once per booking.
+        self._occ: List[List[date]] = []
+        self._index: Dict[int, int] = {}
+        # Secondary indexes for the filtered listing paths.
+        self._by_client: Dict[int, List[int]] = defaultdict(list)
+        self._by_date: List[tuple] = []  # sorted (scheduled_date, booking_id)
+        self._next_id = 0
+
+    def _columns(self) -> tuple:
+        return (self._ids, self._client_ids, self._service_codes, self._dates,
+                self._date_ords, self._repeats, self._occurrences, self._statuses,
+                self._notes, self._charges, self._occ)
+
+    def _row(self, row: int) -> Booking:
+        booking = Booking(id=self._ids[row], client_id=self._client_ids[row],
+                          service_code=self._service_codes[row],
+                          scheduled_date=self._dates[row], repeat=self._repeats[row],
+                          occurrences=self._occurrences[row], status=self._statuses[row],
+                          notes=self._notes[row], unit_charge=self._charges[row])
+        booking._occ_cache = self._occ[row]
+        return booking
+
+    def add(self, client_id: int, service_code: str, scheduled_date: date,
+            repeat: RepeatFrequency = RepeatFrequency.NONE, occurrences: int = 1,
+            notes: Optional[str] = None, unit_charge: Optional[Decimal] = None) -> Booking:
+        self._next_id += 1
+        bid = self._next_id
+        self._index[bid] = len(self._ids)
+        self._ids.append(bid)
+        self._client_ids.append(client_id)
+        self._service_codes.append(sys.intern(_canonical_code(service_code)))
+        self._dates.append(scheduled_date)
+        self._date_ords.append(scheduled_date.toordinal())
+        self._repeats.append(repeat)
+        self._occurrences.append(occurrences)
+        self._statuses.append(BookingStatus.SCHEDULED)
+        self._notes.append(notes)
+        self._charges.append(unit_charge)
+        self._occ.append(_expand_schedule(scheduled_date, repeat, occurrences))
+        self._by_client[client_id].append(bid)
+        bisect.insort(self._by_date, (scheduled_date, bid))
+        return self._row(self._index[bid])
+
+    def bulk_add(self, rows: List[tuple]) -> List[int]:
+        """Append many (client_id, service_code, scheduled_date, repeat,
+        occurrences, notes, unit_charge) rows at once, reserving the whole
+        id range up front.
+
+        Returns the assigned booking ids in row order.
+        """
+        start = self._next_id + 1
+        self._next_id += len(rows)
+        ids = list(range(start, self._next_id + 1))
+        base = len(self._ids)
+        self._index.update((bid, base + i) for i, bid in enumerate(ids))
+        self._ids.extend(ids)
+        for bid, (client_id, service_code, scheduled_date, repeat,
+                  occurrences, notes, unit_charge) in zip(ids, rows):
+            self._client_ids.append(client_id)
+            self._service_codes.append(sys.intern(_canonical_code(service_code)))
+            self._dates.append(scheduled_date)
+            self._date_ords.append(scheduled_date.toordinal())
+            self._repeats.append(repeat)
+            self._occurrences.append(occurrences)
+            self._statuses.append(BookingStatus.SCHEDULED)
+            self._notes.append(notes)
+            self._charges.append(unit_charge)
+            self._occ.append(_expand_schedule(scheduled_date, repeat, occurrences))
+            self._by_client[client_id].append(bid)
+            bisect.insort(self._by_date, (scheduled_date, bid))
+        return ids
+
+    def get(self, booking_id: int) -> Optional[Booking]:
+        row = self._index.get(booking_id)
+        return self._row(row) if row is not None else None
+
+    def update(self, booking_id: int, **kwargs) -> Optional[Booking]:
+        row = self._index.get(booking_id)
+        if row is None:
+            return None
+        columns = {'client_id': self._client_ids, 'service_code': self._service_codes,
+                   'scheduled_date': self._dates, 'repeat': self._repeats,
+                   'occurrences': self._occurrences, 'status': self._statuses,
+                   'notes': self._notes, 'unit_charge': self._charges}
+        new_client = kwargs.get('client_id')
+        if new_client is not None and new_client != self._client_ids[row]:
+            self._by_client[self._client_ids[row]].remove(booking_id)
+            self._by_client[new_client].append(booking_id)
+        new_date = kwargs.get('scheduled_date')
+        if new_date is not None and new_date != self._dates[row]:
+            self._by_date.remove((self._dates[row], booking_id))
+            bisect.insort(self._by_date, (new_date, booking_id))
+            self._date_ords[row] = new_date.toordinal()
+        for key, value in kwargs.items():
+            columns[key][row] = value
+        if kwargs.keys() & {'scheduled_date', 'repeat', 'occurrences'}:
+            self._occ[row] = _expand_schedule(self._dates[row], self._repeats[row],
+                                              self._occurrences[row])
+        return self._row(row)
+
+    def delete(self, booking_id: int) -> bool:
+        row = self._index.pop(booking_id, None)
+        if row is None:
+            return False
+        self._by_client[self._client_ids[row]].remove(booking_id)
+        self._by_date.remove((self._dates[row], booking_id))
+        for column in self._columns():
+            del column[row]
+        for bid, r in self._index.items():
+            if r > row:
+                self._index[bid] = r - 1
+        return True
+
+    def expand_occurrences(self, start: Optional[date] = None,
+                           end: Optional[date] = None) -> List[tuple]:
+        """Flatten every booking's occurrences into (booking_id, date) pairs.
+
+        Reporting-oriented bulk path: works straight over the columns and
+        generates each schedule as a stride of day ordinals, so no Booking
+        views or intermediate timedelta objects are built. ``start``/``end``
+        bound the expansion inclusively.
+        """
+        lo = start.toordinal() if start is not None else 0
+        hi = end.toordinal() if end is not None else None
+        fromordinal = date.fromordinal
+        out: List[tuple] = []
+        append = out.append
+        for bid, base, repeat, count in zip(self._ids, self._date_ords,
+                                            self._repeats, self._occurrences):
+            step = _REPEAT_STEP_DAYS.get(repeat)
+            ordinals = (base,) if step is None or count <= 1 else range(
+                base, base + count * step, step)
+            for o in ordinals:
+                if o < lo:
+                    continue
+                if hi is not None and o > hi:
+                    break
+                append((bid, fromordinal(o)))
+        return out
+
+    def ids_by_client(self, client_id: int) -> List[int]:
+        return self._by_client.get(client_id, [])
+
+    def ids_in_date_range(self, start: Optional[date], end: Optional[date]) -> List[int]:
+        """Booking ids with start <= scheduled_date <= end, in date order."""
+        lo = 0 if start is None else bisect.bisect_left(self._by_date, (start,))
+        hi = (len(self._by_date) if end is None
+              else bisect.bisect_right(self._by_date, (end, float("inf"))))
+        return [bid for _, bid in self._by_date[lo:hi]]
+
+    def list(self) -> Iterable[Booking]:
+        """Lazy view over all bookings; no list is allocated per call."""
+        return (self._row(row) for row in range(len(self._ids)))
+
+    def snapshot(self) -> List[Booking]:
+        """Materialized copy, for callers that mutate while iterating."""
+        return list(self.list())
+
+
+# =====
+# Session facade
+# =====
+
+class Session:
+    """In-memory stand-in for a database session.
+
+    Exposes the small subset of a SQLAlchemy-style session API the menus rely
+    on (``get`` plus context-manager semantics) so the repository functions
+    keep the same shape they will have once a real database lands.
+    """
+
+    def __init__(self, clients: ClientDB, services: ServiceCatalog, bookings: BookingManager) -> None:
+        self.clients = clients
+        self.services = services
+        self.bookings = bookings
+
+    def get(self, model: type, ident: int):
+        if model is Client:
+            return self.clients.get(ident)
+        if model is Service:
+            return self.services.get_by_id(ident)
+        if model is Booking:
+            return self.bookings.get(ident)
+        raise TypeError(f"Unknown model: {model!r}")
+
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_client_db: Optional[ClientDB] = None
+_service_catalog: Optional[ServiceCatalog] = None
+_booking_manager: Optional[BookingManager] = None
+
+
+def init_db() -> None:
+    """Initialise the shared in-memory stores (idempotent)."""
+    global _client_db, _service_catalog, _booking_manager
+    if _client_db is None:
+        _client_db = ClientDB()
+        _service_catalog = ServiceCatalog()
+        _booking_manager = BookingManager()
+
+
+def SessionLocal() -> Session:
+    return Session(_client_db, _service_catalog, _booking_manager)
+
+
+# =====
+# Repository functions
+# =====
+
+def create_client(s: Session, first_name: str, last_name: str, email: Optional[str] = None,
+                  phone: Optional[str] = None, address: Optional[str] = None,
+                  notes: Optional[str] = None) -> Client:
+    return s.clients.add(first_name, last_name, email, phone, address, notes)
+
+
+def update_client(s: Session, client_id: int, **kwargs) -> Optional[Client]:
+    return s.clients.update(client_id, **kwargs)
+
+
+def delete_client(s: Session, client_id: int) -> bool:
+    return s.clients.delete(client_id)
+
+
+def list_clients(s: Session) -> Iterable[Client]:
+    return s.clients.list()
+
+
+def create_service(s: Session, code: str, name: str, description: Optional[str] = None,
+                   base_price: Decimal = Decimal("0.00"), duration_minutes: int = 0) -> Service:
+    return s.services.add(code, name, description, base_price, duration_minutes)
+
+
+def update_service(s: Session, service_id: int, **kwargs) -> Optional[Service]:
+    return s.services.update(service_id, **kwargs)
+
+
+def delete_service(s: Session, service_id: int) -> bool:
+    return s.services.delete(service_id)
+
+
+def list_services(s: Session) -> Iterable[Service]:
+    return s.services.list()
+
+
+def create_booking(s: Session, client_id: int, service_code: str, scheduled_date: date,
+                   repeat: RepeatFrequency = RepeatFrequency.NONE, occurrences: int = 1,
+                   notes: Optional[str] = None, unit_charge: Optional[Decimal] = None) -> Booking:
+    client = s.clients.get(client_id)
+    if not client:
+        raise ValueError(f"Client {client_id} not found")
+    service = s.services.get(service_code)
+    if not service:
+        raise ValueError(f"Service '{service_code}' not found")
+    if occurrences < 1:
+        raise ValueError("Occurrences must be >= 1")
+    charge = unit_charge if unit_charge is not None else service.base_price
+    return s.bookings.add(client_id, service.code, scheduled_date, repeat, occurrences, notes, charge)
+
+
+def get_booking(s: Session, booking_id: int) -> Optional[Booking]:
+    return s.bookings.get(booking_id)
+
+
+def update_booking(s: Session, booking_id: int, **kwargs) -> Optional[Booking]:
+    return s.bookings.update(booking_id, **kwargs)
+
+
+def delete_booking(s: Session, booking_id: int) -> bool:
+    return s.bookings.delete(booking_id)
+
+
+def list_bookings(s: Session, client_id: Optional[int] = None,
+                  status: Optional[BookingStatus] = None,
+                  start_date: Optional[date] = None,
+                  end_date: Optional[date] = None) -> List[Booking]:
+    bm = s.bookings
+    if client_id is None and start_date is None and end_date is None:
+        return [b for b in bm.list() if status is None or b.status == status]
+    if client_id is not None:
+        ids = list(bm.ids_by_client(client_id))
+        if start_date is not None or end_date is not None:
+            in_range = set(bm.ids_in_date_range(start_date, end_date))
+            ids = [bid for bid in ids if bid in in_range]
+    else:
+        ids = bm.ids_in_date_range(start_date, end_date)
+    rows = (bm.get(bid) for bid in ids)
+    return [b for b in rows if status is None or b.status == status]
+
+
+# =====
+# Presentation
+# =====
+
+def _print_clients(clients: ClientDB) -> None:
+    # One buffered write per listing instead of a print (lock + flush) per row.
+    lines = ["\nClients:"]
+    lines.extend(f"  [{cid}] {full_name} | email={email or '-'} | phone={phone or '-'}"
+                 for cid, full_name, email, phone in clients.iter_rows())
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _print_services(services: ServiceCatalog) -> None:
+    lines = ["\nServices:"]
+    lines.extend(f"  [{svc.id}] {svc.code} {svc.name} | ${svc.base_price}"
+                 f" | {svc.duration_minutes}min | {'active' if svc.active else 'inactive'}"
+                 for svc in services.list())
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _print_bookings(bookings: Iterable[Booking], clients: ClientDB) -> None:
+    lines = ["\nBookings:"]
+    for b in bookings:
+        name = clients.full_name_of(b.client_id) or f"client #{b.client_id}"
+        dates = ", ".join(map(date.isoformat, b.occurrence_dates()))
+        lines.append(f"  [{b.id}] {name} | {b.service_code} | {b.status.value}"
+                     f" | repeat={b.repeat.value} x{b.occurrences} | ${b.unit_charge}")
+        lines.append(f"        dates: {dates}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def print_clients(s: Session) -> None:
+    _print_clients(s.clients)
+
+
+def print_services(s: Session) -> None:
+    _print_services(s.services)
+
+
+def print_bookings(s: Session, bookings: Optional[Iterable[Booking]] = None) -> None:
+    rows = bookings if bookings is not None else s.bookings.list()
+    _print_bookings(rows, s.clients)
+
+
+# =====
+# Interactive menus
+# =====
+
+_MAIN_MENU = (
+    "\nLawncare Management - Main Menu\n"
+    "1) Clients\n"
+    "2) Services\n"
+    "3) Bookings\n"
+    "0) Exit\n"
+)
+
+_CLIENTS_MENU = (
+    "\nClients Menu\n"
+    "1) List clients\n"
+    "2) Add client\n"
+    "3) Update client\n"
+    "4) Delete client\n"
+    "0) Back\n"
+)
+
+_SERVICES_MENU = (
+    "\nServices Menu\n"
+    "1) List services\n"
+    "2) Add service\n"
+    "3) Update service\n"
+    "4) Delete service\n"
+    "0) Back\n"
+)
+
+_BOOKINGS_MENU = (
+    "\nBookings Menu\n"
+    "1) List bookings\n"
+    "2) Add booking\n"
+    "3) Update booking status/notes/date\n"
+    "4) Delete booking\n"
+    "5) Search/filter bookings\n"
+    "0) Back\n"
+)
+
+
+def input_decimal(prompt: str) -> Decimal:
+    while True:
+        raw = input(prompt).strip()
+        try:
+            return Decimal(raw)
+        except InvalidOperation:
+            print("Enter a valid amount, e.g. 42.50")
+
+
+def input_date(prompt: str) -> date:
+    while True:
+        raw = input(prompt).strip()
+        try:
+            return date.fromisoformat(raw)
+        except ValueError:
+            print("Enter a date as YYYY-MM-DD")
+
+
+def menu_clients(s: Session) -> None:
+    while True:
+        sys.stdout.write(_CLIENTS_MENU)
+        choice = input("Select: ").strip()
+        try:
+            if choice == "1":
+                print_clients(s)
+            elif choice == "2":
+                first = input("First name: ").strip()
+                last = input("Last name: ").strip()
+                email = input("Email (optional): ").strip() or None
+                phone = input("Phone (optional): ").strip() or None
+                address = input("Address (optional): ").strip() or None
+                notes = input("Notes (optional): ").strip() or None
+                c = create_client(s, first, last, email, phone, address, notes)
+                print(f"Created client #{c.id} {c.full_name}")
+            elif choice == "3":
+                cid = int(input("Client ID: ").strip())
+                c = s.get(Client, cid)
+                if not c:
+                    print("Client not found")
+                    continue
+                print("Leave empty to keep current value")
+                first = input(f"First name [{c.first_name}]: ").strip() or c.first_name
+                last = input(f"Last name [{c.last_name}]: ").strip() or c.last_name
+                email = input(f"Email [{c.email or ''}]: ").strip() or c.email
+                phone = input(f"Phone [{c.phone or ''}]: ").strip() or c.phone
+                address = input(f"Address [{c.address or ''}]: ").strip() or c.address
+                notes = input(f"Notes [{c.notes or ''}]: ").strip() or c.notes
+                update_client(s, cid, first_name=first, last_name=last, email=email,
+                              phone=phone, address=address, notes=notes)
+                print("Updated.")
+            elif choice == "4":
+                cid = int(input("Client ID to delete: ").strip())
+                ok = delete_client(s, cid)
+                print("Deleted" if ok else "Client not found")
+            elif choice == "0":
+                return
+            else:
+                print("Invalid option")
+        except (ValueError, KeyError, InvalidOperation) as e:
+            print(f"Error: {e}")
+
+
+def menu_services(s: Session) -> None:
+    while True:
+        sys.stdout.write(_SERVICES_MENU)
+        choice = input("Select: ").strip()
+        try:
+            if choice == "1":
+                print_services(s)
+            elif choice == "2":
+                code = input("Code (e.g. MOW): ").strip().upper() or "MOW"
                 name = input("Name: ").strip()
                 desc = input("Description (optional): ").strip() or None
                 price = input_decimal("Base price: ")
@@ -36,18 +820,12 @@
                 return
             else:
                 print("Invalid option")
-        except Exception as e:
+        except (ValueError, KeyError, InvalidOperation) as e:
             print(f"Error: {e}")
 
 def menu_bookings(s: Session) -> None:
     while True:
-        print("\nBookings Menu")
-        print("1) List bookings")
-        print("2) Add booking")
-        print("3) Update booking status/notes/date")
-        print("4) Delete booking")
-        print("5) Search/filter bookings")
-        print("0) Back")
+        sys.stdout.write(_BOOKINGS_MENU)
         choice = input("Select: ").strip()
         try:
             if choice == "1":
@@ -59,7 +837,7 @@ def menu_bookings(s: Session) -> None:
                 svc_code = input("Service code: ").strip().upper()
                 sdate = input_date("Scheduled date (YYYY-MM-DD): ")
                 rep = input("Repeat (none/weekly/fortnightly/monthly): ").strip().lower() or 'none'
-                repeat = RepeatFrequency(rep) if rep in RepeatFrequency._value2member_map_ else RepeatFrequency.NONE
+                repeat = _REPEAT_FROM_STR.get(rep, RepeatFrequency.NONE)
                 occ = int(input("Occurrences (>=1): ").strip() or 1)
                 notes = input("Notes (optional): ").strip() or None
                 charge_str = input("Unit charge (blank=use service price): ").strip()
@@ -78,9 +856,12 @@ def menu_bookings(s: Session) -> None:
                 notes = input(f"Notes [{b.notes or ''}]: ").strip()
                 kwargs: dict = {}
                 if date_str:
-                    kwargs['scheduled_date'] = datetime.strptime(date_str, "%Y-%m-%d").date()
+                    kwargs['scheduled_date'] = date.fromisoformat(date_str)
                 if status_str:
-                    kwargs['status'] = BookingStatus(status_str)
+                    status = _STATUS_FROM_STR.get(status_str)
+                    if status is None:
+                        raise ValueError(f"'{status_str}' is not a valid status")
+                    kwargs['status'] = status
                 if notes:
                     kwargs['notes'] = notes
                 update_booking(s, bid, **kwargs)
@@ -93,18 +874,18 @@ def menu_bookings(s: Session) -> None:
                 client_filter = input("Client ID (blank=any): ").strip()
                 cid = int(client_filter) if client_filter else None
                 status_str = input(f"Status filter ({'/'.join([e.value for e in BookingStatus])}|blank=any): ").strip().lower()
-                status = BookingStatus(status_str) if status_str in BookingStatus._value2member_map_ else None
+                status = _STATUS_FROM_STR.get(status_str)
                 sd = input("Start date (YYYY-MM-DD or blank): ").strip()
                 ed = input("End date (YYYY-MM-DD or blank): ").strip()
-                start = datetime.strptime(sd, "%Y-%m-%d").date() if sd else None
-                end = datetime.strptime(ed, "%Y-%m-%d").date() if ed else None
+                start = date.fromisoformat(sd) if sd else None
+                end = date.fromisoformat(ed) if ed else None
                 results = list_bookings(s, client_id=cid, status=status, start_date=start, end_date=end)
                 print_bookings(s, results)
             elif choice == "0":
                 return
             else:
                 print("Invalid option")
-        except Exception as e:
+        except (ValueError, KeyError, InvalidOperation) as e:
             print(f"Error: {e}")
 
 
@@ -124,11 +905,7 @@ def interactive_menu() -> None:
     with SessionLocal() as s:
         seed_defaults(s)
         while True:
-            print("\nLawncare Management - Main Menu")
-            print("1) Clients")
-            print("2) Services")
-            print("3) Bookings")
-            print("0) Exit")
+            sys.stdout.write(_MAIN_MENU)
             ch = input("Select: ").strip()
             if ch == "1":
                 menu_clients(s)
@@ -158,6 +935,9 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         Flask/FastAPI API. You can import models and repository functions in a
         web project and reuse them directly.
     """
+    import argparse  # deferred: only the entrypoint pays the import cost
+    import logging
+
     parser = argparse.ArgumentParser(description="Lawncare Job Management CLI")
     parser.add_argument("--non-interactive", action="store_true", help="Run a short demo and exit")
     args = parser.parse_args(list(argv) if argv is not None else None)
@@ -177,7 +957,13 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
             print_bookings(s)
             return 0
         else:
-            interactive_menu()
+            try:
+                interactive_menu()
+            except Exception:
+                # Menus handle expected input errors; anything reaching here
+                # is a bug worth a traceback rather than a one-line "Error:".
+                logging.exception("Unhandled error in interactive session")
+                return 1
             return 0
 
 